@@ -0,0 +1,515 @@
+"""
+Differential equivalence and fuzz harness for the roster loading paths.
+
+Generates randomized and adversarial roster files, runs each of them through
+the reference logic of Main.py and through every alternate loader, compares
+the resulting singers, warnings and errors, and reports the parsing
+throughput of each path side by side. Main.py is timed only until its
+singer list is complete, not for the report it prints afterwards.
+
+Loaders listed in LOADER_DETECTORS detect the encoding differently from
+Main.py (e.g. with sampled encoding detection). On files where their
+detector picks a different encoding than Main.py's, their differences from
+Main.py are reported separately as divergences, and they are checked
+against Main.py run with their detector instead.
+
+Usage:
+    python EquivalenceHarness.py [--iterations N] [--seed S] [--bench-rows R]
+"""
+import argparse
+import codecs
+import contextlib
+import functools
+import io
+import os
+import random
+import tempfile
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import config
+import FileRead
+import Singer as singer_module
+import SingerLoader
+from Singer import Singer
+
+
+MAIN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Main.py")
+
+Loader = Callable[[str], Tuple[List[Singer], List[str]]]
+Detector = Callable[[str], Optional[str]]
+
+DEFAULT_LOADERS: Dict[str, Loader] = {
+    "streaming": SingerLoader.load_singers,
+    "streaming-sampled": functools.partial(SingerLoader.load_singers, detector=FileRead.detect_encoding_sampled),
+}
+
+LOADER_DETECTORS: Dict[str, Detector] = {
+    "streaming-sampled": FileRead.detect_encoding_sampled,
+}
+
+NAMES = ["Kovács János", "Nagy Anna", "Szabó István", "Kiss Gábor", "Tóth Erzsébet", "Horváth László",
+         "Fekete Katalin", "Balogh Zoltán", "Varga Mária", "Oláh Erika", "Bíró Eszter", "Gál Olga"]
+GENRES = ["Pop", "Rock", "Jazz", "Metal", "Opera", "Blues", "Folk", "Electronic", "Hip-Hop", "Népzene"]
+LOCATIONS = ["Budapest", "Debrecen", "Pécs", "Győr", "Szeged", "Veszprém", "Nyíregyháza", "Hódmezővásárhely",
+             "Székesfehérvár", "Ózd", "Kőszeg", "Körmend", "Tatabánya", "Szekszárd"]
+ENCODINGS = ["utf-8", "utf-8", "cp1250", "cp1250", "iso-8859-2", "utf-8-sig"]
+NEWLINES = ["\r\n", "\n", "\r"]
+
+
+class Outcome(NamedTuple):
+    """The observable result of loading a roster file."""
+    singers: List[Tuple[str, str, Tuple[Tuple[str, str], ...]]]
+    warnings: List[str]
+    error: Optional[str]
+
+
+class PathStats(NamedTuple):
+    """Accumulated parsing time of one loading path."""
+    seconds: float
+    bytes_read: int
+
+
+class Mismatch(NamedTuple):
+    """A roster on which an alternate loader disagreed with the reference (a mismatch or a divergence)."""
+    case: int
+    loader: str
+    differences: List[str]
+    data: bytes
+
+
+class HarnessReport(NamedTuple):
+    """The result of a harness run."""
+    cases: int
+    mismatches: List[Mismatch]
+    divergences: List[Mismatch]
+    stats: Dict[str, PathStats]
+
+
+# =============================================================================
+
+
+def _random_show(rng: random.Random) -> str:
+    location = rng.choice(LOCATIONS)
+    day = f"20{rng.randint(24, 27)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    return rng.choice([
+        f"{location};{day}",
+        f"{location};{day}",
+        f"{location};{day}",
+        f" {location} ; {day} ",
+        f"{location};",
+        f";{day}",
+        f"{location};;{day}",
+        f"{location}{day}",
+        ";",
+        "",
+        "\t\t",
+        f"{location};{day};",
+    ])
+
+
+def _random_singer_line(rng: random.Random) -> str:
+    name = rng.choice(NAMES)
+    genre = rng.choice(GENRES)
+    shows = [_random_show(rng) for _ in range(rng.choice([0, 0, 1, 2, 3, 5]))]
+    line = ",".join([name, genre] + shows)
+    return rng.choice([
+        line, line, line, line, line,
+        f"{name},{genre},\t\t",
+        f"{name}",
+        f",{genre},{_random_show(rng)}",
+        f"{name},,{_random_show(rng)}",
+        f"{name}, ",
+        f"  {line}  ",
+        f"{line},",
+        f"{name};{genre}",
+        f"{name},{genre}",
+    ])
+
+
+def _random_count_line(rng: random.Random, singer_count: int) -> str:
+    if rng.random() < 0.7:
+        return str(singer_count)
+    return rng.choice([
+        f"  {singer_count}\t",
+        str(singer_count + 1),
+        str(max(singer_count - 1, 0)),
+        str(-singer_count - 1),
+        "húsz",
+        f"{singer_count}.0",
+        "",
+    ])
+
+
+def _encode(rng: random.Random, text: str) -> bytes:
+    """Encodes the text with a random encoding, occasionally mixing two encodings."""
+    if rng.random() < 0.1:
+        half = len(text) // 2
+        first, second = rng.sample(["utf-8", "cp1250"], 2)
+        return text[:half].encode(first, errors="replace") + text[half:].encode(second, errors="replace")
+    return text.encode(rng.choice(ENCODINGS), errors="replace")
+
+
+def generate_roster(rng: random.Random) -> bytes:
+    """
+    Generates a random, possibly malformed roster file.
+
+    The rosters contain wrong or invalid count lines, blank and whitespace
+    lines, missing names and genres, stray semicolons, tab-only fields, long
+    pure-ASCII prefixes, different line endings and different or mixed
+    encodings.
+
+    Args:
+        rng: The random number generator to use.
+
+    Returns:
+        The raw content of the roster file.
+    """
+    singer_lines = [_random_singer_line(rng) for _ in range(rng.randint(0, 40))]
+    if rng.random() < 0.2:
+        ascii_lines = [f"Singer {k},Pop,Budapest;2025-01-01" for k in range(rng.randint(50, 200))]
+        singer_lines = ascii_lines + singer_lines
+    lines = [_random_count_line(rng, len(singer_lines))] + singer_lines
+    for _ in range(rng.choice([0, 0, 1, 3])):
+        lines.insert(rng.randint(0, len(lines)), rng.choice(["", "   ", "\t"]))
+    newline = rng.choice(NEWLINES)
+    text = newline.join(lines) + rng.choice(["", newline, newline * 2])
+    return _encode(rng, text)
+
+
+def generate_large_roster(rows: int, seed: int = 0) -> bytes:
+    """
+    Generates a valid cp1250 roster with the given number of singers, for throughput measurements.
+
+    Args:
+        rows: The number of singer lines.
+        seed: The seed of the random number generator.
+
+    Returns:
+        The raw content of the roster file.
+    """
+    rng = random.Random(seed)
+    lines = [str(rows)]
+    for _ in range(rows):
+        shows = [f"{rng.choice(LOCATIONS)};2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+                 for _ in range(rng.randint(0, 4))]
+        lines.append(",".join([rng.choice(NAMES), rng.choice(GENRES)] + shows))
+    return "\r\n".join(lines).encode("cp1250")
+
+
+# =============================================================================
+
+
+def _singer_key(singer: Singer) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+    return singer.name, singer.genre, tuple(singer.performances)
+
+
+def _format_error(error: Exception) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+_main_code = None
+
+
+def _run_main(file_path: str, detector: Optional[Detector] = None) -> Tuple[Outcome, float]:
+    """
+    Executes Main.py on a roster file and times its parsing.
+
+    Returns:
+        The Outcome and the seconds spent until Main.py built its
+        ConcertOrganizer (or finished, if it never got that far).
+    """
+    global _main_code
+    if _main_code is None:
+        with open(MAIN_PATH, "r", encoding="utf-8") as file:
+            _main_code = compile(file.read(), MAIN_PATH, "exec")
+
+    namespace = {"__name__": "__reference__", "__file__": MAIN_PATH}
+    output = io.StringIO()
+    parse_end: List[float] = []
+    organizer_class = singer_module.ConcertOrganizer
+
+    def timed_organizer(*args, **kwargs):
+        parse_end.append(time.perf_counter())
+        return organizer_class(*args, **kwargs)
+
+    original_input, original_detector = config.INPUT_FILE_NAME, FileRead.detect_encoding
+    config.INPUT_FILE_NAME = file_path
+    singer_module.ConcertOrganizer = timed_organizer
+    if detector is not None:
+        FileRead.detect_encoding = detector
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            exec(_main_code, namespace)
+    except Exception as e:
+        return Outcome([], [], _format_error(e)), time.perf_counter() - start
+    finally:
+        config.INPUT_FILE_NAME = original_input
+        singer_module.ConcertOrganizer = organizer_class
+        FileRead.detect_encoding = original_detector
+    seconds = (parse_end[0] if parse_end else time.perf_counter()) - start
+
+    warnings = [line for line in output.getvalue().split("\n") if line.startswith("Warning:")]
+    return Outcome([_singer_key(singer) for singer in namespace["singer_list"]], warnings, None), seconds
+
+
+def run_reference(file_path: str, detector: Optional[Detector] = None) -> Outcome:
+    """
+    Loads a roster file with the reference logic of Main.py.
+
+    Main.py is executed with config.INPUT_FILE_NAME pointing to the file.
+    The printed warnings are captured, and the singer list is taken from the
+    module's globals.
+
+    Args:
+        file_path: The path of the roster file.
+        detector: If given, Main.py detects the encoding with it instead of
+            FileRead.detect_encoding().
+
+    Returns:
+        The Outcome of the reference logic.
+    """
+    return _run_main(file_path, detector)[0]
+
+
+def _run_loader(loader: Loader, file_path: str) -> Tuple[Outcome, float]:
+    """Runs a loader on a roster file; returns the Outcome and the seconds spent in the loader."""
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            singers, warnings = loader(file_path)
+    except Exception as e:
+        return Outcome([], [], _format_error(e)), time.perf_counter() - start
+    seconds = time.perf_counter() - start
+    return Outcome([_singer_key(singer) for singer in singers], list(warnings), None), seconds
+
+
+def run_loader(loader: Loader, file_path: str) -> Outcome:
+    """
+    Loads a roster file with an alternate loader.
+
+    Args:
+        loader: A function taking the file path and returning (singers, warnings).
+        file_path: The path of the roster file.
+
+    Returns:
+        The Outcome of the loader.
+    """
+    return _run_loader(loader, file_path)[0]
+
+
+def compare_outcomes(reference: Outcome, other: Outcome) -> List[str]:
+    """
+    Compares two outcomes.
+
+    Returns:
+        A list of human-readable differences; empty if the outcomes match.
+    """
+    differences = []
+    if reference.error != other.error:
+        differences.append(f"error: expected {reference.error!r}, got {other.error!r}")
+    if reference.warnings != other.warnings:
+        differences.append(f"warnings: expected {reference.warnings!r}, got {other.warnings!r}")
+    if reference.singers != other.singers:
+        missing = [s for s in reference.singers if s not in other.singers]
+        extra = [s for s in other.singers if s not in reference.singers]
+        differences.append(f"singers: {len(reference.singers)} expected, {len(other.singers)} loaded; "
+                           f"missing {missing[:3]!r}, unexpected {extra[:3]!r}")
+    return differences
+
+
+def _normalize_encoding(encoding: Optional[str]) -> Optional[str]:
+    try:
+        return codecs.lookup(encoding).name if encoding else None
+    except LookupError:
+        return encoding
+
+
+def detectors_disagree(file_path: str, detector: Detector) -> bool:
+    """
+    Checks whether a detector picks a different encoding than Main.py does.
+
+    Args:
+        file_path: The path of the roster file.
+        detector: The encoding detector of an alternate loader.
+
+    Returns:
+        True if the detector and FileRead.detect_encoding() detect different
+        encodings (or only one of them detects any).
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        reference = FileRead.detect_encoding(file_path)
+        other = detector(file_path)
+    return _normalize_encoding(reference) != _normalize_encoding(other)
+
+
+def _add_stats(stats: Dict[str, PathStats], path: str, seconds: float, bytes_read: int) -> None:
+    previous = stats.get(path, PathStats(0.0, 0))
+    stats[path] = PathStats(previous.seconds + seconds, previous.bytes_read + bytes_read)
+
+
+def check_file(file_path: str, loaders: Optional[Dict[str, Loader]] = None,
+               stats: Optional[Dict[str, PathStats]] = None,
+               divergences: Optional[Dict[str, List[str]]] = None) -> Dict[str, List[str]]:
+    """
+    Runs one roster file through the reference logic and every loader.
+
+    A loader listed in LOADER_DETECTORS whose detector disagrees with
+    Main.py's on this file is compared with Main.py run with that detector;
+    its differences from the plain Main.py run are divergences.
+
+    Args:
+        file_path: The path of the roster file.
+        loaders: The alternate loaders by name; defaults to DEFAULT_LOADERS.
+        stats: If given, the parsing time of each path is accumulated into it.
+        divergences: If given, the divergences of each loader are put into it.
+
+    Returns:
+        A dict mapping the name of each loader that disagreed with its
+        reference to the list of differences.
+    """
+    loaders = DEFAULT_LOADERS if loaders is None else loaders
+    size = os.path.getsize(file_path)
+    reference, seconds = _run_main(file_path)
+    if stats is not None:
+        _add_stats(stats, "reference", seconds, size)
+
+    detector_references: Dict[Detector, Outcome] = {}
+    mismatches = {}
+    for name, loader in loaders.items():
+        outcome, seconds = _run_loader(loader, file_path)
+        if stats is not None:
+            _add_stats(stats, name, seconds, size)
+
+        expected = reference
+        detector = LOADER_DETECTORS.get(name)
+        if detector is not None and detectors_disagree(file_path, detector):
+            differences = compare_outcomes(reference, outcome)
+            if differences and divergences is not None:
+                divergences[name] = differences
+            if detector not in detector_references:
+                detector_references[detector] = run_reference(file_path, detector)
+            expected = detector_references[detector]
+
+        differences = compare_outcomes(expected, outcome)
+        if differences:
+            mismatches[name] = differences
+    return mismatches
+
+
+def run_harness(iterations: int = 200, seed: int = 0,
+                loaders: Optional[Dict[str, Loader]] = None) -> HarnessReport:
+    """
+    Runs randomized and adversarial rosters through every path and compares the outcomes.
+
+    Each case is generated from its own seed, so a failing case can be
+    regenerated with generate_roster(random.Random(f"{seed}:{case}")).
+
+    Args:
+        iterations: The number of generated rosters.
+        seed: The base seed of the generator.
+        loaders: The alternate loaders by name; defaults to DEFAULT_LOADERS.
+
+    Returns:
+        A HarnessReport with the mismatches, the divergences and the
+        parsing time of each path.
+
+    Raises:
+        ValueError: If iterations is not a positive integer.
+    """
+    if not isinstance(iterations, int) or iterations < 1:
+        raise ValueError("The number of iterations must be a positive integer.")
+
+    stats: Dict[str, PathStats] = {}
+    mismatches: List[Mismatch] = []
+    divergences: List[Mismatch] = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        file_path = os.path.join(work_dir, "roster.txt")
+        for case in range(iterations):
+            data = generate_roster(random.Random(f"{seed}:{case}"))
+            with open(file_path, "wb") as file:
+                file.write(data)
+            case_divergences: Dict[str, List[str]] = {}
+            for name, differences in check_file(file_path, loaders, stats, case_divergences).items():
+                mismatches.append(Mismatch(case, name, differences, data))
+            for name, differences in case_divergences.items():
+                divergences.append(Mismatch(case, name, differences, data))
+    return HarnessReport(iterations, mismatches, divergences, stats)
+
+
+def benchmark(rows: int, loaders: Optional[Dict[str, Loader]] = None, repeat: int = 3) -> Dict[str, PathStats]:
+    """
+    Measures the throughput of every path on a large valid roster.
+
+    The outcomes are compared as well; a mismatch raises an error, since
+    a speedup only counts if the results are the same. Divergences (see
+    LOADER_DETECTORS) do not.
+
+    Args:
+        rows: The number of singer lines in the generated roster.
+        loaders: The alternate loaders by name; defaults to DEFAULT_LOADERS.
+        repeat: The number of runs per path; the fastest one is kept.
+
+    Returns:
+        A dict mapping each path to the parsing time of its fastest run.
+
+    Raises:
+        AssertionError: If a loader disagrees with the reference.
+    """
+    stats: Dict[str, PathStats] = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        file_path = os.path.join(work_dir, "roster.txt")
+        with open(file_path, "wb") as file:
+            file.write(generate_large_roster(rows))
+        for _ in range(repeat):
+            run_stats: Dict[str, PathStats] = {}
+            mismatches = check_file(file_path, loaders, run_stats, divergences={})
+            if mismatches:
+                raise AssertionError(f"Loaders disagree with the reference: {mismatches}")
+            for path, path_stats in run_stats.items():
+                if path not in stats or path_stats.seconds < stats[path].seconds:
+                    stats[path] = path_stats
+    return stats
+
+
+def format_stats(stats: Dict[str, PathStats]) -> str:
+    """Formats the parsing time of each path as a table, with the speedup relative to the reference."""
+    reference = stats.get("reference")
+    lines = [f"{'path':<20}{'seconds':>10}{'MB/s':>10}{'speedup':>10}"]
+    for path, path_stats in stats.items():
+        throughput = path_stats.bytes_read / path_stats.seconds / 1e6 if path_stats.seconds else float("inf")
+        speedup = reference.seconds / path_stats.seconds if reference and path_stats.seconds else float("nan")
+        lines.append(f"{path:<20}{path_stats.seconds:>10.3f}{throughput:>10.2f}{speedup:>9.2f}x")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the roster loading paths against Main.py.")
+    parser.add_argument("--iterations", type=int, default=200, help="number of generated rosters")
+    parser.add_argument("--seed", type=int, default=0, help="base seed of the generator")
+    parser.add_argument("--bench-rows", type=int, default=100_000,
+                        help="singer lines in the throughput benchmark (0 to skip)")
+    args = parser.parse_args()
+
+    report = run_harness(args.iterations, args.seed)
+    print(f"Fuzzed {report.cases} rosters, {len(report.mismatches)} mismatch(es), "
+          f"{len(report.divergences)} divergence(s) from the encoding detection of Main.py.")
+    for title, entries in (("Mismatch", report.mismatches), ("Divergence", report.divergences)):
+        for entry in entries:
+            print(f"\n{title} in case {entry.case} ({entry.loader}), data: {entry.data[:200]!r}")
+            for difference in entry.differences:
+                print(f"  - {difference}")
+    print("\nFuzz parsing throughput:")
+    print(format_stats(report.stats))
+
+    if args.bench_rows > 0:
+        print(f"\nBenchmark parsing throughput ({args.bench_rows} singers):")
+        print(format_stats(benchmark(args.bench_rows)))
+
+    if report.mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+import contextlib
+import csv
+import json
+import os
+import stat
+import tempfile
+from typing import Iterable, Iterator, List, TextIO, Union
+
+from Singer import Singer, ConcertOrganizer
+from config import EXPORT_CHUNK_SIZE, EXPORT_BUFFER_SIZE
+
+
+SingerSource = Union[ConcertOrganizer, Iterable[Singer]]
+
+CSV_HEADER = ("name", "genre", "location", "date")
+COUNT_LINE_WIDTH = 20  # Width of the reserved count line when the number of singers is not known up front.
+ADATOK_FORBIDDEN = (",", "\n", "\r")  # Characters that would split a field or a line of adatok.txt when read back in text mode.
+
+
+def _iter_singers(source: SingerSource) -> Iterator[Singer]:
+    """
+    Iterates over the singers of an organizer or any iterable of singers.
+
+    Args:
+        source: A ConcertOrganizer, or an iterable of Singer objects
+            (e.g. the list returned by find_singers_with_most_performances()).
+
+    Yields:
+        The Singer objects of the source, in order.
+
+    Raises:
+        TypeError: If the source yields an object that is not a Singer.
+    """
+    singers = source.singers if isinstance(source, ConcertOrganizer) else source
+    for singer in singers:
+        if not isinstance(singer, Singer):
+            raise TypeError(f"Only Singer objects can be exported. Found: {singer!r}")
+        yield singer
+
+
+def _write_chunked(file, lines: Iterable[str], chunk_size: int) -> None:
+    """
+    Writes lines to a text file in chunks of chunk_size lines.
+
+    Each chunk is joined and written with a single write() call instead of
+    writing (or printing) line by line.
+    """
+    chunk: List[str] = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            file.write("".join(chunk))
+            chunk.clear()
+    if chunk:
+        file.write("".join(chunk))
+
+
+def _new_file_mode(file_path: str) -> int:
+    """
+    Returns the permission bits the exported file should get: those of the
+    file being replaced, or the default ones for a new file (0o666 minus the umask).
+    """
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+@contextlib.contextmanager
+def _open_for_export(file_path: str, encoding: str, newline: str) -> Iterator[TextIO]:
+    """
+    Opens a temporary file next to file_path for writing an export.
+
+    The temporary file replaces file_path only if the export succeeds. If
+    it fails (e.g. a TypeError for a non-Singer, a ValueError for a field
+    containing a separator, or a UnicodeEncodeError), the temporary file is
+    removed and file_path is left untouched, so no truncated export is
+    ever left behind.
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(file_path)}.", suffix=".tmp", dir=directory)
+    try:
+        with open(fd, "w", encoding=encoding, newline=newline, buffering=EXPORT_BUFFER_SIZE) as file:
+            yield file
+        os.chmod(temp_path, _new_file_mode(file_path))
+        os.replace(temp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    """
+    Checks that chunk_size is a positive integer.
+
+    Raises:
+        ValueError: If chunk_size is not a positive integer.
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("Chunk size must be a positive integer.")
+
+
+def export_csv(source: SingerSource, file_path: str, encoding: str = "utf-8",
+               chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+    """
+    Exports singers to a CSV file with one row per performance.
+
+    The header is name,genre,location,date. Singers without performances
+    get a single row with empty location and date.
+
+    Args:
+        source: A ConcertOrganizer or an iterable of Singer objects.
+        file_path: The path of the output file. It is only written if the
+            export succeeds.
+        encoding: The encoding of the output file.
+        chunk_size: Number of rows handed to the CSV writer at once.
+
+    Returns:
+        The number of singers written.
+
+    Raises:
+        TypeError: If the source contains non-Singer objects.
+        ValueError: If chunk_size is not a positive integer.
+    """
+    _check_chunk_size(chunk_size)
+    count = 0
+    with _open_for_export(file_path, encoding, newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_HEADER)
+        rows: List[tuple] = []
+        for singer in _iter_singers(source):
+            count += 1
+            name, genre = singer.name, singer.genre
+            performances = singer.performances
+            if performances:
+                rows.extend((name, genre, location, date) for location, date in performances)
+            else:
+                rows.append((name, genre, "", ""))
+            if len(rows) >= chunk_size:
+                writer.writerows(rows)
+                rows.clear()
+        if rows:
+            writer.writerows(rows)
+    return count
+
+
+def export_jsonl(source: SingerSource, file_path: str, encoding: str = "utf-8",
+                 chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+    """
+    Exports singers to a JSON Lines file with one JSON object per singer.
+
+    Each line has the form
+    {"name": ..., "genre": ..., "performances": [[location, date], ...]}.
+
+    Args:
+        source: A ConcertOrganizer or an iterable of Singer objects.
+        file_path: The path of the output file. It is only written if the
+            export succeeds.
+        encoding: The encoding of the output file.
+        chunk_size: Number of lines collected before they are written.
+
+    Returns:
+        The number of singers written.
+
+    Raises:
+        TypeError: If the source contains non-Singer objects.
+        ValueError: If chunk_size is not a positive integer.
+    """
+    _check_chunk_size(chunk_size)
+    count = 0
+
+    def lines() -> Iterator[str]:
+        nonlocal count
+        encoder = json.JSONEncoder(ensure_ascii=False)
+        for singer in _iter_singers(source):
+            count += 1
+            yield encoder.encode({
+                "name": singer.name,
+                "genre": singer.genre,
+                "performances": singer.performances,
+            }) + "\n"
+
+    with _open_for_export(file_path, encoding, newline="\n") as file:
+        _write_chunked(file, lines(), chunk_size)
+    return count
+
+
+def _format_adatok_line(singer: Singer) -> str:
+    """
+    Formats a singer as a line of the native input format.
+
+    Raises:
+        ValueError: If a field contains a separator that would make the line
+            unreadable for the input parser.
+    """
+    name, genre = singer.name, singer.genre
+    if any(char in field for field in (name, genre) for char in ADATOK_FORBIDDEN):
+        raise ValueError(f"Singer name and genre cannot contain ',' or line breaks. Found: {name!r}, {genre!r}")
+    fields = [name, genre]
+    for location, date in singer.performances:
+        show = f"{location};{date}"
+        if any(char in show for char in ADATOK_FORBIDDEN) or show.count(";") != 1:
+            raise ValueError(f"Location and date cannot contain ',', ';' or line breaks. Found: {(location, date)}")
+        fields.append(show)
+    return ",".join(fields) + "\n"
+
+
+def export_adatok(source: SingerSource, file_path: str, encoding: str = "utf-8",
+                  chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+    """
+    Exports singers in the native input format (see adatok.txt).
+
+    The first line holds the number of singers, followed by one
+    name,genre,location;date,... line per singer. If the source has a known
+    length (an organizer or a list) the count is written directly. Otherwise
+    a fixed-width count line is reserved and filled in after the singers
+    have been written, so the source is still traversed only once. The
+    padded count is read back correctly because the parser strips every line.
+
+    Args:
+        source: A ConcertOrganizer or an iterable of Singer objects.
+        file_path: The path of the output file. It is only written if the
+            export succeeds.
+        encoding: The encoding of the output file. It must encode digits and
+            spaces as one byte each (e.g. 'utf-8', 'cp1250', 'latin-2').
+        chunk_size: Number of lines collected before they are written.
+
+    Returns:
+        The number of singers written.
+
+    Raises:
+        TypeError: If the source contains non-Singer objects.
+        ValueError: If chunk_size is not a positive integer, or if a field
+            contains a separator character of the format.
+    """
+    _check_chunk_size(chunk_size)
+    if isinstance(source, ConcertOrganizer):
+        source = source.singers
+    known_count = len(source) if hasattr(source, "__len__") else None
+    count = 0
+
+    def lines() -> Iterator[str]:
+        nonlocal count
+        for singer in _iter_singers(source):
+            count += 1
+            yield _format_adatok_line(singer)
+
+    with _open_for_export(file_path, encoding, newline="\n") as file:
+        if known_count is not None:
+            file.write(f"{known_count}\n")
+            _write_chunked(file, lines(), chunk_size)
+        else:
+            file.write(" " * COUNT_LINE_WIDTH + "\n")
+            _write_chunked(file, lines(), chunk_size)
+            file.seek(0)
+            file.write(str(count).rjust(COUNT_LINE_WIDTH))
+    return count
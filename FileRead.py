@@ -1,5 +1,32 @@
+import codecs
+import io
+import os
+import re
+from typing import BinaryIO, Callable, Iterator, List
+
 import charset_normalizer
-from config import MIN_CONFIDENCE, DETECTION_BUFFER_SIZE
+from config import MIN_CONFIDENCE, DETECTION_BUFFER_SIZE, DETECTION_SAMPLE_COUNT, READ_CHUNK_SIZE
+
+
+class FileDecodeError(ValueError):
+    """
+    Raised when a file cannot be decoded with the given encoding.
+
+    Attributes:
+        file_path (str): The path of the file.
+        encoding (str): The encoding used for decoding.
+        offset (int): The byte offset (from the start of the file) of the
+            first byte that could not be decoded.
+        reason (str): The reason reported by the codec.
+    """
+
+    def __init__(self, file_path: str, encoding: str, offset: int, reason: str):
+        self.file_path = file_path
+        self.encoding = encoding
+        self.offset = offset
+        self.reason = reason
+        super().__init__(f"Could not decode file {file_path} with encoding {encoding} "
+                         f"at byte offset {offset}: {reason}")
 
 
 def detect_encoding(file_path: str) -> str | None:
@@ -17,32 +44,39 @@ def detect_encoding(file_path: str) -> str | None:
         - Encoding detection fails or the confidence level is below MIN_CONFIDENCE.
         - An unexpected error occurs during the process.
     """
+    return _detect(file_path, lambda file: file.read(DETECTION_BUFFER_SIZE))
+
+
+def _detect(file_path: str, read_sample: Callable[[BinaryIO], bytes]) -> str | None:
+    """
+    Runs encoding detection on the bytes returned by read_sample for the open file.
+
+    Shared by detect_encoding() and detect_encoding_sampled(); see their
+    docstrings for when None is returned.
+    """
     try:
         with open(file_path, 'rb') as file:
-            raw_data = file.read(DETECTION_BUFFER_SIZE)
-            if not raw_data: 
+            raw_data = read_sample(file)
+            if not raw_data:
                 print(f"Empty file: {file_path}")
-                return None 
-                
+                return None
+
             # charset_normalizer használata chardet helyett
             detection_result = charset_normalizer.detect(raw_data)
-            
+
             if detection_result and detection_result['encoding'] and\
                detection_result['confidence'] > MIN_CONFIDENCE:
                 return detection_result['encoding']
-            else:
-                confidence = detection_result.get('confidence', 0) if\
-                      detection_result else 0
-                print(f"Encoding detection confidence ({confidence}) is below "
-                      f"threshold ({MIN_CONFIDENCE}) or encoding not found for\
-                         file: {file_path}")
-                return None
+            confidence = detection_result.get('confidence', 0) if\
+                detection_result else 0
+            print(f"Encoding detection confidence ({confidence}) is below "
+                  f"threshold ({MIN_CONFIDENCE}) or encoding not found for file: {file_path}")
+            return None
     except FileNotFoundError:
         print(f"File not found: {file_path}")
         return None
     except Exception as e:
-        print(f"An error occurred during encoding detection for file \
-              {file_path}: {e}")
+        print(f"An error occurred during encoding detection for file {file_path}: {e}")
         return None
 
 
@@ -58,7 +92,9 @@ def read_file_content(file_path: str) -> str | None:
         - The file is not found.
         - The file is empty (leading to failed encoding detection).
         - Encoding detection fails or is unreliable.
-        - A UnicodeDecodeError occurs when reading with the detected encoding.
+        - A UnicodeDecodeError occurs when reading with the detected encoding
+          (the printed message includes the byte offset of the first
+          undecodable byte).
         - Any other unexpected error occurs during file access or reading.
     """
     encoding = detect_encoding(file_path)
@@ -71,8 +107,12 @@ def read_file_content(file_path: str) -> str | None:
             content = file.read()
         return content
 
-    except UnicodeDecodeError:
-        print(f"UnicodeDecodeError: Could not decode file {file_path} with detected encoding {encoding}")
+    except UnicodeDecodeError as e:
+        # read() decodes the whole file in one call, so e.object holds all of its
+        # bytes (minus a BOM already stripped by the codec) and ends at the end of the file.
+        offset = os.path.getsize(file_path) - len(e.object) + e.start
+        print(f"UnicodeDecodeError: Could not decode file {file_path} with detected encoding {encoding} "
+              f"at byte offset {offset}: {e.reason}")
         return None
     except FileNotFoundError:
         print(f"File not found: {file_path}")
@@ -80,3 +120,176 @@ def read_file_content(file_path: str) -> str | None:
     except Exception as e:
         print(f"An error occurred while reading file {file_path}: {e}")
         return None
+
+
+def _trim_window(window: bytes, trim_start: bool, trim_end: bool) -> bytes:
+    """
+    Cuts a sampled window back to whole lines, so multi-byte characters are
+    not split at its edges.
+
+    A window without a newline (a line longer than the window) is kept and
+    only cut at its first and last ASCII byte instead. An ASCII byte is a
+    character boundary in UTF-8 and in every single-byte encoding, so this
+    drops at most one partial character at each edge.
+    """
+    if trim_start:
+        newline = window.find(b'\n')
+        if newline != -1:
+            window = window[newline + 1:]
+        else:
+            start = re.search(rb'[\x00-\x7f]', window)
+            if start:
+                window = window[start.start():]
+    if trim_end:
+        newline = window.rfind(b'\n')
+        if newline != -1:
+            window = window[:newline + 1]
+        else:
+            end = re.search(rb'[\x00-\x7f][\x80-\xff]*\Z', window)
+            if end:
+                window = window[:end.start() + 1]
+    return window
+
+
+def _read_samples(file: BinaryIO, file_size: int, sample_count: int, window_size: int) -> bytes:
+    """
+    Reads sample_count windows spread evenly across an open binary file.
+
+    Every window is trimmed with _trim_window() at the edges where it was
+    cut out of the file.
+    """
+    if file_size <= sample_count * window_size:
+        return file.read()
+
+    samples: List[bytes] = []
+    last_start = file_size - window_size
+    for i in range(sample_count):
+        start = i * last_start // (sample_count - 1)
+        file.seek(start)
+        window = _trim_window(file.read(window_size), i > 0, i < sample_count - 1)
+        if window:
+            samples.append(window)
+    return b''.join(samples)
+
+
+def detect_encoding_sampled(file_path: str, sample_count: int = DETECTION_SAMPLE_COUNT,
+                            window_size: int = DETECTION_BUFFER_SIZE) -> str | None:
+    """
+    Detects the encoding of the file from several windows spread across it.
+
+    Unlike detect_encoding(), which only looks at the beginning of the file,
+    this samples sample_count windows of window_size bytes from the start,
+    the end and evenly spaced points in between (using seek). This way a
+    large cp1250/latin-2 file whose first kilobyte is pure ASCII is still
+    detected correctly, while at most sample_count * window_size bytes are
+    read regardless of the file size.
+
+    Args:
+        file_path: The path of the file.
+        sample_count: The number of windows to sample. Must be at least 2.
+        window_size: The size of each window in bytes.
+
+    Returns:
+        The detected encoding as a string, or None if:
+        - The file is not found.
+        - The file is empty.
+        - Encoding detection fails or the confidence level is below MIN_CONFIDENCE.
+        - An unexpected error occurs during the process.
+
+    Raises:
+        ValueError: If sample_count is less than 2 or window_size is not positive.
+    """
+    if sample_count < 2:
+        raise ValueError("At least two samples are needed for sampled encoding detection.")
+    if window_size < 1:
+        raise ValueError("Window size must be a positive integer.")
+
+    def read_sample(file: BinaryIO) -> bytes:
+        file_size = os.fstat(file.fileno()).st_size
+        return _read_samples(file, file_size, sample_count, window_size)
+
+    return _detect(file_path, read_sample)
+
+
+def iter_file_chunks(file_path: str, encoding: str | None = None,
+                     chunk_size: int = READ_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Reads and decodes a file chunk by chunk, in bounded memory.
+
+    The bytes are decoded with the codec's incremental decoder, so
+    multi-byte characters split across chunk boundaries are handled.
+    Newlines are translated the same way as by open() in text mode, so the
+    joined chunks equal the content returned by read_file_content() for
+    the same encoding.
+
+    Args:
+        file_path: The path of the file.
+        encoding: The encoding of the file. If None, it is detected with
+            detect_encoding_sampled().
+        chunk_size: The number of bytes read at a time.
+
+    Yields:
+        The decoded text of the file, chunk by chunk.
+
+    Raises:
+        ValueError: If chunk_size is not positive or the encoding could not be detected.
+        LookupError: If the encoding is unknown.
+        FileDecodeError: If the file cannot be decoded; it carries the byte
+            offset of the first undecodable byte.
+        FileNotFoundError: If the file is not found.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be a positive integer.")
+    if encoding is None:
+        encoding = detect_encoding_sampled(file_path)
+        if encoding is None:
+            raise ValueError(f"Could not detect encoding for file: {file_path}")
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors='strict')
+    newline_decoder = io.IncrementalNewlineDecoder(decoder, translate=True)
+    offset = 0
+
+    with open(file_path, 'rb') as file:
+        while True:
+            raw_data = file.read(chunk_size)
+            offset += len(raw_data)
+            try:
+                text = newline_decoder.decode(raw_data, final=not raw_data)
+            except UnicodeDecodeError as e:
+                # e.object holds the bytes the codec was decoding: the unconsumed
+                # bytes of earlier chunks plus this one, minus anything it already
+                # stripped (the BOM of utf-8-sig). It always ends at offset.
+                raise FileDecodeError(file_path, encoding, offset - len(e.object) + e.start, e.reason) from None
+            if text:
+                yield text
+            if not raw_data:
+                break
+
+
+def iter_file_lines(file_path: str, encoding: str | None = None,
+                    chunk_size: int = READ_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Reads a file line by line using iter_file_chunks().
+
+    The lines are split exactly like read_file_content(file_path).split('\\n'):
+    they do not include the newline, and a trailing newline produces a
+    final empty line.
+
+    Args:
+        file_path: The path of the file.
+        encoding: The encoding of the file. If None, it is detected with
+            detect_encoding_sampled().
+        chunk_size: The number of bytes read at a time.
+
+    Yields:
+        The lines of the file.
+
+    Raises:
+        The same exceptions as iter_file_chunks().
+    """
+    remainder = ''
+    for chunk in iter_file_chunks(file_path, encoding, chunk_size):
+        lines = (remainder + chunk).split('\n')
+        remainder = lines.pop()
+        yield from lines
+    yield remainder
@@ -1,4 +1,9 @@
-from typing import List, Tuple, Optional
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from datetime import date
+from itertools import chain
+from typing import Dict, List, Set, Tuple, Optional
 
 
 class Singer:
@@ -295,4 +300,204 @@ class ConcertOrganizer:
             raise ValueError("No singers registered to find the one with the most performances.")
 
         max_performances = max(len(singer.performances) for singer in self._singers)
-        return [singer for singer in self._singers if len(singer.performances) == max_performances]
\ No newline at end of file
+        return [singer for singer in self._singers if len(singer.performances) == max_performances]
+
+    def _location_sets(self) -> List[Set[str]]:
+        """Returns the distinct locations (stripped of surrounding whitespace) of each singer, by index."""
+        return [{location.strip() for location, _ in singer._performances} for singer in self._singers]
+
+    @staticmethod
+    def _build_location_index(location_sets: List[Set[str]], order: List[int]) -> Dict[str, List[int]]:
+        """
+        Builds an inverted index from locations to the singers performing there.
+
+        Args:
+            location_sets: The distinct locations of each singer, by index.
+            order: The indices of the singers to index, in the order they are ranked.
+
+        Returns:
+            A dict mapping each location to the ascending list of ranks
+            (positions in order) of the singers who perform there.
+        """
+        index: Dict[str, List[int]] = defaultdict(list)
+        for rank, i in enumerate(order):
+            for location in location_sets[i]:
+                index[location].append(rank)
+        return index
+
+    @staticmethod
+    def _count_shared_after(index: Dict[str, List[int]], locations: Set[str],
+                            rank: int, end_rank: Optional[int] = None) -> Counter:
+        """
+        Counts the locations one singer shares with each singer ranked after it.
+
+        Only the part of each posting list between rank and end_rank is
+        visited (found with bisect), and the counts are collected by a single
+        Counter, so only the counts of this one singer are held in memory.
+
+        Args:
+            index: The location index built by _build_location_index().
+            locations: The distinct locations of the singer.
+            rank: The rank of the singer in the index.
+            end_rank: If given, singers ranked at or after it are not counted.
+
+        Returns:
+            A Counter mapping the ranks of the other singers to the number of
+            locations they share with the singer.
+        """
+        postings = []
+        for location in locations:
+            ranks = index[location]
+            start = bisect_right(ranks, rank)
+            stop = len(ranks) if end_rank is None else bisect_left(ranks, end_rank, start)
+            postings.append(ranks[start:stop])
+        return Counter(chain.from_iterable(postings))
+
+    def find_singers_sharing_locations(self, min_shared: int = 1) -> List[Tuple[Singer, Singer, int]]:
+        """
+        Finds all pairs of singers whose tours share at least min_shared locations.
+
+        Args:
+            min_shared: The minimum number of distinct shared locations.
+
+        Returns:
+            A list of (singer, other_singer, shared_location_count) tuples,
+            ordered by the shared location count (highest first), then by
+            registration order.
+
+        Raises:
+            ValueError: If min_shared is not a positive integer.
+        """
+        if not isinstance(min_shared, int) or min_shared < 1:
+            raise ValueError("The minimum number of shared locations must be a positive integer.")
+
+        location_sets = self._location_sets()
+        index = self._build_location_index(location_sets, list(range(len(self._singers))))
+        pairs = []
+        for i, locations in enumerate(location_sets):
+            if len(locations) < min_shared:
+                continue
+            for j, count in self._count_shared_after(index, locations, i).items():
+                if count >= min_shared:
+                    pairs.append((i, j, count))
+        pairs.sort(key=lambda pair: (-pair[2], pair[0], pair[1]))
+        return [(self._singers[i], self._singers[j], count) for i, j, count in pairs]
+
+    def find_most_similar_singers(self, top_n: int = 10,
+                                  singer: Optional[Singer] = None) -> List[Tuple[Singer, Singer, float]]:
+        """
+        Finds the most similar singers by the Jaccard similarity of their location sets.
+
+        The similarity of two singers is the number of shared locations divided
+        by the number of locations visited by either of them. Pairs without a
+        shared location (similarity 0) are not returned.
+
+        Without a singer, the singers are processed one at a time in order of
+        their location count, and only the top_n best pairs are kept in a
+        heap. Once the heap is full, partners with so many more locations that
+        their similarity (at most the ratio of the two location counts) cannot
+        reach the worst pair in the heap are not counted at all, and partners
+        sharing too few locations are skipped.
+
+        Args:
+            top_n: The maximum number of pairs to return.
+            singer: If given, only pairs containing this singer are considered,
+                and it is always the first element of the returned pairs.
+
+        Returns:
+            A list of at most top_n (singer, other_singer, similarity) tuples,
+            ordered by similarity (highest first), then by registration order.
+
+        Raises:
+            ValueError: If top_n is not a positive integer, or if the given
+                singer is not registered with the organizer.
+        """
+        if not isinstance(top_n, int) or top_n < 1:
+            raise ValueError("The number of pairs to return must be a positive integer.")
+
+        location_sets = self._location_sets()
+        if singer is not None:
+            if singer not in self._singers:
+                raise ValueError(f"Singer {singer.name} is not registered with the organizer.")
+            target = self._singers.index(singer)
+            index = self._build_location_index(location_sets, list(range(len(self._singers))))
+            shared = self._count_shared_after(index, location_sets[target], -1)
+            shared.pop(target, None)
+            scored = (
+                (count / (len(location_sets[target]) + len(location_sets[j]) - count), target, j)
+                for j, count in shared.items()
+            )
+            best = heapq.nsmallest(top_n, scored, key=lambda item: (-item[0], item[2]))
+            return [(self._singers[i], self._singers[j], similarity) for similarity, i, j in best]
+
+        order = sorted((i for i, locations in enumerate(location_sets) if locations),
+                       key=lambda i: (len(location_sets[i]), i))
+        sizes = [len(location_sets[i]) for i in order]
+        index = self._build_location_index(location_sets, order)
+
+        # Min-heap of (similarity, -i, -j): heap[0] is the worst of the best pairs so far.
+        heap: List[Tuple[float, int, int]] = []
+        for rank, i in enumerate(order):
+            size = sizes[rank]
+            end_rank, min_count = None, 1
+            if len(heap) == top_n:
+                threshold = heap[0][0]
+                end_rank = bisect_left(sizes, True, rank + 1, key=lambda other_size: size / other_size < threshold)
+                # Partners have at least size locations, so fewer than
+                # 2 * size * threshold / (1 + threshold) shared ones cannot reach the threshold.
+                min_count = max(1, int(2 * size * threshold / (1 + threshold)))
+            for other_rank, count in self._count_shared_after(index, location_sets[i], rank, end_rank).most_common():
+                if count < min_count:
+                    break
+                j = order[other_rank]
+                item = (count / (size + sizes[other_rank] - count), -min(i, j), -max(i, j))
+                if len(heap) < top_n:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+
+        best = sorted(heap, reverse=True)
+        return [(self._singers[-i], self._singers[-j], similarity) for similarity, i, j in best]
+
+    def find_co_booking_candidates(self, max_days: int) -> List[Tuple[Singer, Singer, str, str, str]]:
+        """
+        Finds pairs of singers performing in the same location within max_days of each other.
+
+        Dates must be in ISO format (YYYY-MM-DD); performances with other
+        dates are ignored. Each location's performances are sorted by date
+        and scanned with a sliding window, so only performances that are
+        close in time are compared.
+
+        Args:
+            max_days: The maximum number of days between the two performances.
+
+        Returns:
+            A list of (singer, other_singer, location, date, other_date)
+            tuples, ordered by location, then by date.
+
+        Raises:
+            ValueError: If max_days is not a non-negative integer.
+        """
+        if not isinstance(max_days, int) or max_days < 0:
+            raise ValueError("The maximum number of days must be a non-negative integer.")
+
+        bookings: Dict[str, List[Tuple[date, int, str]]] = defaultdict(list)
+        for i, singer in enumerate(self._singers):
+            for location, date_str in singer._performances:
+                try:
+                    day = date.fromisoformat(date_str.strip())
+                except ValueError:
+                    continue
+                bookings[location.strip()].append((day, i, date_str))
+
+        candidates = []
+        for location in sorted(bookings):
+            events = sorted(bookings[location])
+            for a, (day, i, date_str) in enumerate(events):
+                for b in range(a + 1, len(events)):
+                    other_day, j, other_date_str = events[b]
+                    if (other_day - day).days > max_days:
+                        break
+                    if i != j:
+                        candidates.append((self._singers[i], self._singers[j], location, date_str, other_date_str))
+        return candidates
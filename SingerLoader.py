@@ -0,0 +1,97 @@
+from typing import Callable, List, Tuple
+
+import FileRead
+from Singer import Singer
+from config import READ_CHUNK_SIZE
+
+
+def load_singers(file_path: str,
+                 detector: Callable[[str], str | None] = FileRead.detect_encoding,
+                 chunk_size: int = READ_CHUNK_SIZE) -> Tuple[List[Singer], List[str]]:
+    """
+    Loads singers from a roster file in the native format, streaming it line by line.
+
+    Applies exactly the same rules as Main.py (count line, line filtering,
+    skipped lines and their warnings, performance parsing), but reads the
+    file through FileRead.iter_file_lines() instead of decoding it in one
+    piece, and returns the warnings instead of printing them.
+
+    Args:
+        file_path: The path of the roster file.
+        detector: The function used to detect the encoding of the file.
+        chunk_size: The number of bytes read at a time.
+
+    Returns:
+        A tuple (singers, warnings): the list of loaded Singer objects and
+        the list of warning messages for the skipped lines, in file order.
+
+    Raises:
+        ValueError: With the same message as Main.py if the file cannot be
+            read, is empty, has an invalid count line, or the number of
+            singer lines does not match the count.
+    """
+    encoding = detector(file_path)
+    if encoding is None:
+        print(f"Could not detect encoding for file: {file_path}")
+        raise ValueError("Could not read the file.")
+
+    singers: List[Singer] = []
+    warnings: List[str] = []
+    n = None
+    i = 0
+
+    try:
+        for raw_line in FileRead.iter_file_lines(file_path, encoding, chunk_size):
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            if n is None:
+                try:
+                    n = int(line)
+                    if n < 0:
+                        raise ValueError("Number of singers cannot be negative.")
+                except ValueError:
+                    raise ValueError('The 1st line of the file must be an integer.')
+                continue
+
+            i += 1
+            if i > n:
+                continue
+
+            parts = line.split(',')
+
+            if len(parts) < 2:
+                warnings.append(f"Warning: Skipping line {i+1} due to incomplete data: '{line}'.")
+                continue
+
+            name = parts[0].strip()
+            genre = parts[1].strip()
+
+            if not name:
+                warnings.append(f"Warning: Skipping the {i+1}th line because the singer's name is missing: '{line}'")
+                continue
+            if not genre:
+                warnings.append(f"Warning: Skipping the {i+1}th line because the singer's genre is missing: '{line}'")
+                continue
+
+            performances = []
+
+            if len(parts) > 2:
+                for show in parts[2:]:
+                    show_list = show.strip().split(';')
+                    if len(show_list) == 2 and all(item.strip() for item in show_list):
+                        performances.append(tuple(show_list))
+
+            singers.append(Singer(name, genre, performances))
+    except (FileRead.FileDecodeError, LookupError, OSError) as e:
+        print(f"An error occurred while reading file {file_path}: {e}")
+        raise ValueError("Could not read the file.") from e
+
+    if n is None:
+        raise ValueError(f"Error: File '{file_path}' is empty or contains only whitespace. Exiting.")
+
+    if i != n:
+        raise ValueError(f"File format error: Expected {n} singer data lines (plus the first line with the count), but found {i} data lines.")
+
+    return singers, warnings
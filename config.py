@@ -1,3 +1,7 @@
 MIN_CONFIDENCE = 0.7  # Minimum confidence level for encoding detection to be considered reliable.
 DETECTION_BUFFER_SIZE = 1024  # Number of bytes to read for encoding detection.
 INPUT_FILE_NAME = "adatok.txt"  # The name of the input file containing singer data.
+EXPORT_CHUNK_SIZE = 1000  # Number of rows collected before they are flushed to the output file in one write.
+EXPORT_BUFFER_SIZE = 1024 * 1024  # Size of the write buffer (in bytes) used by the exporters.
+DETECTION_SAMPLE_COUNT = 8  # Number of windows (of DETECTION_BUFFER_SIZE bytes each) sampled across large files for encoding detection.
+READ_CHUNK_SIZE = 64 * 1024  # Number of bytes read and decoded at a time by the chunked file reader.
@@ -0,0 +1,106 @@
+import unittest
+import csv
+import json
+import os
+import tempfile
+from Singer import Singer, ConcertOrganizer
+from Exporter import export_csv, export_jsonl, export_adatok, COUNT_LINE_WIDTH
+
+class TestExporter(unittest.TestCase):
+
+    def setUp(self):
+        self.singer_pop = Singer("Pop Star", "Pop", [("Budapest", "2025-05-10"), ("Debrecen", "2025-06-15")])
+        self.singer_opera = Singer("Tóth Erzsébet", "Opera", [])
+        self.singer_folk = Singer("Folk Singer", "Folk", [("Győr", "2025-03-15"), ("Pécs", "2025-04-25"), ("Eger", "2025-07-15")])
+        self.organizer = ConcertOrganizer([self.singer_pop, self.singer_opera, self.singer_folk])
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "export.out")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def read_text(self, encoding="utf-8"):
+        with open(self.path, "r", encoding=encoding, newline="") as file:
+            return file.read()
+
+    def test_export_csv_rows_per_performance(self):
+        count = export_csv(self.organizer, self.path, chunk_size=2)
+        self.assertEqual(count, 3)
+        with open(self.path, "r", encoding="utf-8", newline="") as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[0], ["name", "genre", "location", "date"])
+        self.assertEqual(len(rows), 1 + 2 + 1 + 3)
+        self.assertIn(["Tóth Erzsébet", "Opera", "", ""], rows)
+        self.assertIn(["Folk Singer", "Folk", "Győr", "2025-03-15"], rows)
+
+    def test_export_jsonl_one_object_per_singer(self):
+        count = export_jsonl(self.organizer, self.path, chunk_size=1)
+        self.assertEqual(count, 3)
+        records = [json.loads(line) for line in self.read_text().splitlines()]
+        self.assertEqual([record["name"] for record in records], ["Pop Star", "Tóth Erzsébet", "Folk Singer"])
+        self.assertEqual(records[0]["performances"], [["Budapest", "2025-05-10"], ["Debrecen", "2025-06-15"]])
+        self.assertEqual(records[1]["performances"], [])
+
+    def test_export_query_result(self):
+        top = self.organizer.find_singers_with_most_performances()
+        count = export_jsonl(top, self.path)
+        self.assertEqual(count, 1)
+        self.assertIn("Folk Singer", self.read_text())
+
+    def test_export_adatok_with_known_count(self):
+        count = export_adatok(self.organizer, self.path, encoding="cp1250", chunk_size=2)
+        self.assertEqual(count, 3)
+        lines = self.read_text(encoding="cp1250").split("\n")
+        self.assertEqual(lines[0], "3")
+        self.assertEqual(lines[1], "Pop Star,Pop,Budapest;2025-05-10,Debrecen;2025-06-15")
+        self.assertEqual(lines[2], "Tóth Erzsébet,Opera")
+
+    def test_export_adatok_from_generator_fills_in_count(self):
+        count = export_adatok((singer for singer in self.organizer.singers), self.path)
+        self.assertEqual(count, 3)
+        lines = self.read_text().split("\n")
+        self.assertEqual(len(lines[0]), COUNT_LINE_WIDTH)
+        self.assertEqual(int(lines[0].strip()), 3)
+        self.assertEqual(lines[3], "Folk Singer,Folk,Győr;2025-03-15,Pécs;2025-04-25,Eger;2025-07-15")
+
+    def test_export_adatok_separator_in_field_raises_value_error(self):
+        with self.assertRaisesRegex(ValueError, "cannot contain"):
+            export_adatok([Singer("Smith, John", "Pop", [])], self.path)
+        with self.assertRaisesRegex(ValueError, "cannot contain"):
+            export_adatok([Singer("John", "Pop", [("Bp;Park", "2025-01-01")])], self.path)
+
+    def test_export_adatok_carriage_return_in_field_raises_value_error(self):
+        with self.assertRaisesRegex(ValueError, "cannot contain"):
+            export_adatok([Singer("A\rB", "Pop", [])], self.path)
+        with self.assertRaisesRegex(ValueError, "cannot contain"):
+            export_adatok([Singer("John", "Pop", [("Bp\r", "2025-01-01")])], self.path)
+
+    def test_failed_export_leaves_nothing_behind(self):
+        singers = [Singer(f"Singer {i}", "Pop", []) for i in range(5)] + [Singer("Smith, John", "Pop", [])]
+        with self.assertRaisesRegex(ValueError, "cannot contain"):
+            export_adatok(singers, self.path, chunk_size=1)
+        with self.assertRaises(TypeError):
+            export_jsonl([self.singer_pop, "not a singer"], self.path, chunk_size=1)
+        with self.assertRaises(UnicodeEncodeError):
+            export_csv(self.organizer, self.path, encoding="ascii", chunk_size=1)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_failed_export_keeps_previous_file(self):
+        export_adatok(self.organizer, self.path)
+        previous = self.read_text()
+        with self.assertRaisesRegex(ValueError, "cannot contain"):
+            export_adatok([self.singer_pop, Singer("Smith, John", "Pop", [])], self.path, chunk_size=1)
+        self.assertEqual(self.read_text(), previous)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["export.out"])
+
+    def test_export_non_singer_raises_type_error(self):
+        with self.assertRaisesRegex(TypeError, "Only Singer objects can be exported."):
+            export_csv([self.singer_pop, "not a singer"], self.path)
+
+    def test_export_invalid_chunk_size_raises_value_error(self):
+        with self.assertRaisesRegex(ValueError, "Chunk size must be a positive integer."):
+            export_jsonl(self.organizer, self.path, chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main(argv=['first-arg-is-ignored'], exit=False)
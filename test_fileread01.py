@@ -0,0 +1,109 @@
+import unittest
+import contextlib
+import io
+import os
+import tempfile
+from FileRead import (detect_encoding, detect_encoding_sampled, read_file_content,
+                      iter_file_chunks, iter_file_lines, FileDecodeError)
+
+class TestFileRead(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "adatok.txt")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_bytes(self, data):
+        with open(self.path, "wb") as file:
+            file.write(data)
+
+    def assert_detected(self, text, encoding):
+        detected = detect_encoding_sampled(self.path)
+        self.assertIsNotNone(detected)
+        with open(self.path, "rb") as file:
+            self.assertEqual(file.read().decode(detected), text.encode(encoding).decode(encoding))
+
+    def test_detect_encoding_sampled_large_cp1250_file_with_ascii_prefix(self):
+        lines = ["2000"]
+        lines += [f"Singer {i},Pop,Budapest;2025-01-01" for i in range(1000)]
+        lines += [f"Tóth Erzsébet {i},Opera,Győr;2025-03-15,Pécs;2025-04-25,Székesfehérvár;2025-05-05"
+                  for i in range(1000)]
+        text = "\n".join(lines) + "\n"
+        self.write_bytes(text.encode("cp1250"))
+        self.assertEqual(detect_encoding(self.path), "ascii")
+        self.assert_detected(text, "cp1250")
+
+    def test_detect_encoding_sampled_long_lines(self):
+        shows = ",".join(f"Győr;2025-03-{i % 28 + 1:02d},Pécs;2025-04-{i % 28 + 1:02d}" for i in range(60))
+        lines = ["50"] + [f"Kovács Ödön {i},Népzene,{shows}" for i in range(50)]
+        text = "\n".join(lines) + "\n"
+        self.assertGreater(len(lines[1].encode("cp1250")), 1024)
+        self.write_bytes(text.encode("cp1250"))
+        self.assert_detected(text, "cp1250")
+
+    def test_detect_encoding_sampled_empty_file_returns_none(self):
+        self.write_bytes(b"")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(detect_encoding_sampled(self.path))
+
+    def test_detect_encoding_sampled_invalid_arguments_raise_value_error(self):
+        with self.assertRaisesRegex(ValueError, "At least two samples"):
+            detect_encoding_sampled(self.path, sample_count=1)
+        with self.assertRaisesRegex(ValueError, "Window size must be a positive integer."):
+            detect_encoding_sampled(self.path, window_size=0)
+
+    def test_iter_file_chunks_multibyte_characters_split_across_chunks(self):
+        text = "Kovács Ödön,Népzene,Győr;2025-03-15\n"
+        for encoding, data in (("utf-8", (text + "🎤").encode("utf-8")),
+                               ("utf-8-sig", text.encode("utf-8-sig")),
+                               ("cp1250", text.encode("cp1250"))):
+            with self.subTest(encoding=encoding):
+                self.write_bytes(data)
+                chunks = list(iter_file_chunks(self.path, encoding, chunk_size=1))
+                self.assertEqual("".join(chunks), data.decode(encoding))
+
+    def test_iter_file_lines_cr_lf_and_crlf_line_endings(self):
+        self.write_bytes(b"3\rA,Pop\nB,Rock\r\nC,Folk\r\n")
+        expected = ["3", "A,Pop", "B,Rock", "C,Folk", ""]
+        for chunk_size in (1, 2, 3, 64):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(list(iter_file_lines(self.path, "utf-8", chunk_size)), expected)
+        with open(self.path, "r", encoding="utf-8") as file:
+            self.assertEqual(file.read().split("\n"), expected)
+
+    def test_iter_file_chunks_decode_error_offsets(self):
+        cases = [
+            ("utf-8", b"ab\xc3\xa9cd\xff", 6),
+            ("utf-8", b"abc\xc3", 3),
+            ("utf-8-sig", b"\xef\xbb\xbfabcdef\xff", 9),
+            ("utf-8-sig", b"\xef\xbb\xbf\xff", 3),
+            ("cp1250", b"abc\xe9\r\nd\x98", 7),
+        ]
+        for encoding, data, offset in cases:
+            self.write_bytes(data)
+            for chunk_size in range(1, len(data) + 2):
+                with self.subTest(encoding=encoding, data=data, chunk_size=chunk_size):
+                    with self.assertRaises(FileDecodeError) as context:
+                        list(iter_file_chunks(self.path, encoding, chunk_size))
+                    self.assertEqual(context.exception.offset, offset)
+                    self.assertEqual(context.exception.encoding, encoding)
+                    self.assertIsInstance(context.exception, ValueError)
+
+    def test_iter_file_chunks_invalid_chunk_size_raises_value_error(self):
+        with self.assertRaisesRegex(ValueError, "Chunk size must be a positive integer."):
+            list(iter_file_chunks(self.path, "utf-8", chunk_size=0))
+
+    def test_read_file_content_decode_error_reports_offset(self):
+        for prefix in (b"", b"\xef\xbb\xbf"):
+            with self.subTest(prefix=prefix):
+                data = prefix + "Kovács Ödön,Népzene,Győr;2025-03-15\r\n".encode("utf-8") * 3000
+                self.write_bytes(data + b"\xff\n")
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    self.assertIsNone(read_file_content(self.path))
+                self.assertIn(f"at byte offset {len(data)}", output.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
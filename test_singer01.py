@@ -1,5 +1,8 @@
 import unittest
+import itertools
+import random
 import re
+from datetime import date, timedelta
 from Singer import Singer, ConcertOrganizer 
 
 class TestSinger(unittest.TestCase):
@@ -272,5 +275,91 @@ class TestConcertOrganizer(unittest.TestCase):
         self.assertIn(self.singer_jazz, result)
 
 
+    def setup_touring_organizer(self):
+        self.singer_a = Singer("Singer A", "Pop", [("Budapest", "2025-05-10"), ("Debrecen", "2025-06-15"), ("Eger", "2025-07-01")])
+        self.singer_b = Singer("Singer B", "Rock", [("Budapest", "2025-05-12"), (" Debrecen ", "2025-09-01")])
+        self.singer_c = Singer("Singer C", "Jazz", [("Eger", "2025-07-20"), ("Szeged", "2025-08-01")])
+        self.singer_d = Singer("Singer D", "Folk", [("Pécs", "2025-05-10")])
+        return ConcertOrganizer([self.singer_a, self.singer_b, self.singer_c, self.singer_d])
+
+    def test_find_singers_sharing_locations(self):
+        organizer = self.setup_touring_organizer()
+        result = organizer.find_singers_sharing_locations()
+        self.assertEqual(result, [(self.singer_a, self.singer_b, 2), (self.singer_a, self.singer_c, 1)])
+        result = organizer.find_singers_sharing_locations(min_shared=2)
+        self.assertEqual(result, [(self.singer_a, self.singer_b, 2)])
+
+    def test_find_singers_sharing_locations_invalid_min_shared_raises_value_error(self):
+        organizer = self.setup_touring_organizer()
+        with self.assertRaisesRegex(ValueError, "positive integer"):
+            organizer.find_singers_sharing_locations(min_shared=0)
+
+    def test_find_most_similar_singers(self):
+        organizer = self.setup_touring_organizer()
+        result = organizer.find_most_similar_singers(top_n=1)
+        self.assertEqual(result, [(self.singer_a, self.singer_b, 2 / 3)])
+        result = organizer.find_most_similar_singers()
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[1], (self.singer_a, self.singer_c, 1 / 4))
+
+    def test_find_most_similar_singers_for_one_singer(self):
+        organizer = self.setup_touring_organizer()
+        result = organizer.find_most_similar_singers(singer=self.singer_c)
+        self.assertEqual(result, [(self.singer_c, self.singer_a, 1 / 4)])
+        self.assertEqual(organizer.find_most_similar_singers(singer=self.singer_d), [])
+
+    def test_find_most_similar_singers_unknown_singer_raises_value_error(self):
+        organizer = self.setup_touring_organizer()
+        with self.assertRaisesRegex(ValueError, "is not registered"):
+            organizer.find_most_similar_singers(singer=self.singer_pop)
+
+    def test_find_co_booking_candidates(self):
+        organizer = self.setup_touring_organizer()
+        organizer.add_singer(self.singer_rock)
+        result = organizer.find_co_booking_candidates(max_days=7)
+        self.assertEqual(result, [(self.singer_a, self.singer_b, "Budapest", "2025-05-10", "2025-05-12")])
+        result = organizer.find_co_booking_candidates(max_days=30)
+        self.assertEqual(len(result), 2)
+        self.assertIn((self.singer_a, self.singer_c, "Eger", "2025-07-01", "2025-07-20"), result)
+
+    def test_find_co_booking_candidates_invalid_max_days_raises_value_error(self):
+        organizer = self.setup_touring_organizer()
+        with self.assertRaisesRegex(ValueError, "non-negative integer"):
+            organizer.find_co_booking_candidates(max_days=-1)
+
+    def setup_dense_organizer(self, count, cities, seed=0):
+        rng = random.Random(seed)
+        singers = [Singer(f"Singer {i}", "Pop", [(f"City {rng.randrange(cities)}", "2025-05-10")
+                                                 for _ in range(rng.randint(1, 5))])
+                   for i in range(count)]
+        return ConcertOrganizer(singers)
+
+    def test_find_most_similar_singers_matches_all_pairs_on_dense_locations(self):
+        organizer = self.setup_dense_organizer(150, 8)
+        locations = [{location for location, _ in singer.performances} for singer in organizer.singers]
+        expected = sorted(
+            (-len(locations[i] & locations[j]) / len(locations[i] | locations[j]), i, j)
+            for i, j in itertools.combinations(range(len(locations)), 2)
+            if locations[i] & locations[j]
+        )
+        for top_n in (1, 10, 100):
+            result = organizer.find_most_similar_singers(top_n=top_n)
+            self.assertEqual(result, [(organizer.singers[i], organizer.singers[j], -similarity)
+                                      for similarity, i, j in expected[:top_n]])
+        shared = organizer.find_singers_sharing_locations(min_shared=2)
+        self.assertEqual(len(shared), sum(1 for i, j in itertools.combinations(range(len(locations)), 2)
+                                          if len(locations[i] & locations[j]) >= 2))
+
+    def test_find_co_booking_candidates_many_events_in_one_location(self):
+        singers = [Singer(f"Singer {i}", "Pop", [("Budapest", (date(2025, 1, 1) + timedelta(days=i)).isoformat())])
+                   for i in range(20000)]
+        organizer = ConcertOrganizer(singers)
+        self.assertEqual(organizer.find_co_booking_candidates(max_days=0), [])
+        result = organizer.find_co_booking_candidates(max_days=1)
+        self.assertEqual(len(result), len(singers) - 1)
+        self.assertEqual(result[0], (singers[0], singers[1], "Budapest", "2025-01-01", "2025-01-02"))
+
+
+
 if __name__ == '__main__':
     unittest.main(argv=['first-arg-is-ignored'], exit=False)
@@ -0,0 +1,83 @@
+import unittest
+import os
+import tempfile
+import EquivalenceHarness
+import FileRead
+from SingerLoader import load_singers
+
+ADATOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "adatok.txt")
+
+def broken_loader(file_path, detector=FileRead.detect_encoding):
+    singers, warnings = load_singers(file_path, detector)
+    return singers[:-1], warnings
+
+def broken_sampled_loader(file_path):
+    return broken_loader(file_path, FileRead.detect_encoding_sampled)
+
+class TestSingerLoader(unittest.TestCase):
+
+    def test_load_singers_adatok(self):
+        singers, warnings = load_singers(ADATOK_PATH)
+        self.assertEqual(len(singers), 20)
+        self.assertEqual(warnings, [])
+        self.assertEqual(singers[0].name, "Kovács János")
+        self.assertEqual(singers[0].performances, [("Budapest", "2025-05-10"), ("Debrecen", "2025-06-15")])
+
+    def test_load_singers_keeps_singer_with_empty_shows(self):
+        singers, _ = load_singers(ADATOK_PATH)
+        opera = [singer for singer in singers if singer.name == "Tóth Erzsébet"]
+        self.assertEqual(len(opera), 1)
+        self.assertEqual(opera[0].genre, "Opera")
+        self.assertEqual(opera[0].performances, [])
+
+    def test_load_singers_small_chunks_match_default(self):
+        singers, _ = load_singers(ADATOK_PATH)
+        chunked, _ = load_singers(ADATOK_PATH, chunk_size=1)
+        self.assertEqual([(s.name, s.genre, s.performances) for s in chunked],
+                         [(s.name, s.genre, s.performances) for s in singers])
+
+class TestEquivalenceHarness(unittest.TestCase):
+
+    def test_run_harness_has_no_mismatches(self):
+        report = EquivalenceHarness.run_harness(iterations=50, seed=0)
+        self.assertEqual(report.cases, 50)
+        self.assertEqual(report.mismatches, [], "\n".join(
+            f"case {mismatch.case} ({mismatch.loader}): {mismatch.differences}" for mismatch in report.mismatches))
+        self.assertTrue(report.divergences)
+        self.assertTrue(all(divergence.loader in EquivalenceHarness.LOADER_DETECTORS
+                            for divergence in report.divergences))
+
+    def test_check_file_adatok_matches_reference(self):
+        divergences = {}
+        self.assertEqual(EquivalenceHarness.check_file(ADATOK_PATH, divergences=divergences), {})
+        self.assertEqual(divergences, {})
+
+    def test_broken_loader_is_reported_as_mismatch(self):
+        mismatches = EquivalenceHarness.check_file(ADATOK_PATH, {"broken": broken_loader})
+        self.assertEqual(list(mismatches), ["broken"])
+        self.assertIn("singers: 20 expected, 19 loaded", mismatches["broken"][0])
+
+        report = EquivalenceHarness.run_harness(iterations=10, seed=0, loaders={"broken": broken_loader})
+        self.assertTrue(report.mismatches)
+        self.assertEqual({mismatch.loader for mismatch in report.mismatches}, {"broken"})
+        self.assertEqual(report.divergences, [])
+
+    def test_sampled_loader_is_checked_where_detectors_disagree(self):
+        lines = ["300"] + [f"Singer {i},Pop,Budapest;2025-01-01" for i in range(150)]
+        lines += [f"Tóth Erzsébet {i},Opera,Győr;2025-03-15" for i in range(150)]
+        with tempfile.TemporaryDirectory() as work_dir:
+            file_path = os.path.join(work_dir, "roster.txt")
+            with open(file_path, "wb") as file:
+                file.write("\r\n".join(lines).encode("cp1250"))
+            self.assertTrue(EquivalenceHarness.detectors_disagree(file_path, FileRead.detect_encoding_sampled))
+
+            divergences = {}
+            self.assertEqual(EquivalenceHarness.check_file(file_path, divergences=divergences), {})
+            self.assertEqual(list(divergences), ["streaming-sampled"])
+
+            mismatches = EquivalenceHarness.check_file(file_path, {"streaming-sampled": broken_sampled_loader})
+            self.assertEqual(list(mismatches), ["streaming-sampled"])
+            self.assertIn("singers: 300 expected, 299 loaded", mismatches["streaming-sampled"][0])
+
+if __name__ == '__main__':
+    unittest.main()